@@ -6,7 +6,6 @@ import org.springframework.web.cors.CorsConfiguration;
 import org.springframework.web.cors.UrlBasedCorsConfigurationSource;
 import org.springframework.web.filter.CorsFilter;
 
-import java.util.Arrays;
 import java.util.List;
 
 @Configuration
@@ -20,7 +19,7 @@ public class CorsConfig {
         config.setAllowCredentials(true);
 
         // Allowed origins (frontend URLs)
-        config.setAllowedOrigins(Arrays.asList(
+        config.setAllowedOrigins(List.of(
             "http://localhost:5173",
             "http://localhost:4200",
             "http://localhost:8080",
@@ -28,12 +27,12 @@ public class CorsConfig {
         ));
 
         // Allowed HTTP methods
-        config.setAllowedMethods(Arrays.asList(
+        config.setAllowedMethods(List.of(
             "GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"
         ));
 
         // Allowed headers
-        config.setAllowedHeaders(Arrays.asList(
+        config.setAllowedHeaders(List.of(
             "Authorization",
             "Content-Type",
             "X-Requested-With",
@@ -45,7 +44,7 @@ public class CorsConfig {
         ));
 
         // Exposed headers (visible to client)
-        config.setExposedHeaders(Arrays.asList(
+        config.setExposedHeaders(List.of(
             "Authorization",
             "Content-Type"
         ));
@@ -32,9 +32,6 @@ public class FIPResponseDtoToEntityMapper {
     @Value("${app.user.id:Prabal864}")
     private String defaultUserId;
 
-    // Store raw transaction data with account information for mapping
-    private final Map<String, TransactionDataEntry> transactionDataMap = new HashMap<>();
-
     @Autowired
     public FIPResponseDtoToEntityMapper(TransactionMapper transactionMapper) {
         this.transactionMapper = transactionMapper;
@@ -43,9 +40,6 @@ public class FIPResponseDtoToEntityMapper {
     }
 
     public FiDataBundle mapToEntity(FIPResponseDTO dto) {
-        // Clear transaction map before mapping
-        transactionDataMap.clear();
-
         log.info("Mapping FIPResponseDTO to entity for consent ID: {}, user: {}",
                 dto.getConsentId(), defaultUserId);
 
@@ -62,22 +56,37 @@ public class FIPResponseDtoToEntityMapper {
     }
 
     /**
-     * Extract all transactions as DynamoDB entities
-     * This should be called after mapToEntity to get transactions for DynamoDB
+     * Extract all transactions of the response as DynamoDB entities
+     * Raw transactions are collected per call, so concurrent ingests never share mapper state
      */
-    public List<Transaction> extractAllTransactions(String consentId) {
+    public List<Transaction> extractAllTransactions(FIPResponseDTO dto) {
+        String consentId = dto.getConsentId();
         log.info("Extracting all transactions for consent {}, user: {}",
                 consentId, defaultUserId);
 
+        // Raw transaction data keyed by account reference number
+        Map<String, List<FIPResponseDTO.Fip.Account.AccountData.AccountDetail.Transactions.Transaction>> txnDataByAccount =
+                new LinkedHashMap<>();
+        for (FIPResponseDTO.Fip fip : Optional.ofNullable(dto.getFips()).orElse(List.of())) {
+            for (FIPResponseDTO.Fip.Account account : Optional.ofNullable(fip.getAccounts()).orElse(List.of())) {
+                List<FIPResponseDTO.Fip.Account.AccountData.AccountDetail.Transactions.Transaction> txnData =
+                        rawTransactions(account);
+                if (txnData != null && !txnData.isEmpty()) {
+                    txnDataByAccount.put(account.getLinkRefNumber(), txnData);
+                }
+            }
+        }
+
         List<Transaction> allTransactions = new ArrayList<>();
 
-        for (TransactionDataEntry entry : transactionDataMap.values()) {
-            // Use the dedicated transaction mapper
+        for (Map.Entry<String, List<FIPResponseDTO.Fip.Account.AccountData.AccountDetail.Transactions.Transaction>> entry
+                : txnDataByAccount.entrySet()) {
+            // Use the dedicated transaction mapper; FiAccount IDs are only assigned on save, so none exist yet
             List<Transaction> transactions = transactionMapper.mapToDynamoDbTransactions(
-                    entry.transactions,
-                    entry.accountNumber,
+                    entry.getValue(),
+                    entry.getKey(),
                     consentId,
-                    entry.fiAccountId
+                    null
             );
 
             allTransactions.addAll(transactions);
@@ -121,46 +130,22 @@ public class FIPResponseDtoToEntityMapper {
     private FiAccount mapAccount(FIPResponseDTO.Fip.Account dto) {
         FiAccount.AccountData data = mapAccountData(dto.getData());
 
-        // Extract raw transaction data but don't map it yet
-        List<FIPResponseDTO.Fip.Account.AccountData.AccountDetail.Transactions.Transaction> txnData =
-                Optional.ofNullable(dto.getData())
-                        .map(FIPResponseDTO.Fip.Account.AccountData::getAccount)
-                        .map(FIPResponseDTO.Fip.Account.AccountData.AccountDetail::getTransactions)
-                        .map(FIPResponseDTO.Fip.Account.AccountData.AccountDetail.Transactions::getTransaction)
-                        .orElse(null);
-
-        // Build account WITHOUT transactions
-        FiAccount entity = FiAccount.builder()
+        // Build account WITHOUT transactions - they're extracted separately for DynamoDB
+        return FiAccount.builder()
                 .maskedAccNumber(dto.getMaskedAccNumber())
                 .linkRefNumber(dto.getLinkRefNumber())
                 .fistatus(dto.getFIstatus())
                 .data(data)
-                // No transactions here - they'll be handled separately
                 .build();
-
-        // Store the entity ID after it's created
-        Long accountId = entity.getId();
-
-        // Store raw transaction data with account information for later processing
-        if (txnData != null && !txnData.isEmpty()) {
-            TransactionDataEntry entry = new TransactionDataEntry();
-            entry.transactions = txnData;
-            entry.accountNumber = dto.getLinkRefNumber();
-            entry.fiAccountId = accountId;
-
-            transactionDataMap.put(dto.getLinkRefNumber(), entry);
-            log.debug("Stored {} raw transactions for account {}, user: {}",
-                    txnData.size(), dto.getLinkRefNumber(), defaultUserId);
-        }
-
-        return entity;
     }
 
-    // Helper class to store transaction data with account information
-    private static class TransactionDataEntry {
-        List<FIPResponseDTO.Fip.Account.AccountData.AccountDetail.Transactions.Transaction> transactions;
-        String accountNumber;
-        Long fiAccountId;
+    private List<FIPResponseDTO.Fip.Account.AccountData.AccountDetail.Transactions.Transaction> rawTransactions(
+            FIPResponseDTO.Fip.Account dto) {
+        return Optional.ofNullable(dto.getData())
+                .map(FIPResponseDTO.Fip.Account.AccountData::getAccount)
+                .map(FIPResponseDTO.Fip.Account.AccountData.AccountDetail::getTransactions)
+                .map(FIPResponseDTO.Fip.Account.AccountData.AccountDetail.Transactions::getTransaction)
+                .orElse(null);
     }
 
     // Remaining methods unchanged...
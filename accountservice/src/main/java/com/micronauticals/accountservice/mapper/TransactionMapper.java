@@ -33,13 +33,24 @@ public class TransactionMapper {
             String consentId,
             Long fiAccountId) {
 
+        LocalDateTime now = LocalDateTime.now();
+        return mapToDynamoDbTransaction(dto, accountNumber, consentId, fiAccountId,
+                now.format(timestampFormatter), now.format(dateFormatter));
+    }
+
+    private Transaction mapToDynamoDbTransaction(
+            FIPResponseDTO.Fip.Account.AccountData.AccountDetail.Transactions.Transaction dto,
+            String accountNumber,
+            String consentId,
+            Long fiAccountId,
+            String timestamp,
+            String date) {
+
         if (dto == null) {
             log.warn("Attempted to map null transaction DTO to DynamoDB, user: {}", defaultUserId);
             return null;
         }
 
-        String timestamp = LocalDateTime.now().format(timestampFormatter);
-        String date = LocalDateTime.now().format(dateFormatter);
         String txnId = dto.getTxnId() != null ? dto.getTxnId() :
                 "txn-" + System.currentTimeMillis();
         String amount = dto.getAmount();
@@ -52,7 +63,7 @@ public class TransactionMapper {
         return Transaction.builder()
                 // Primary key components
                 .pk("CONSENTID#" + consentId)
-                .sk("ACCOUNT#"+ accountNumber + "TIMESTAMP#" + timestamp)
+                .sk("ACCOUNT#" + accountNumber + "#TIMESTP#" + dto.getTransactionTimestamp())
 
                 .pk_GSI_1("MODE#"+ mode)
                 .sk_GSI_1("AMT#" + amount)
@@ -106,8 +117,13 @@ public class TransactionMapper {
         log.info("Mapping {} transactions to DynamoDB format for account {}, user: {}",
                 dtos.size(), accountNumber, defaultUserId);
 
+        // Format the mapping time once for the whole batch instead of twice per transaction
+        LocalDateTime now = LocalDateTime.now();
+        String timestamp = now.format(timestampFormatter);
+        String date = now.format(dateFormatter);
+
         return dtos.stream()
-                .map(dto -> mapToDynamoDbTransaction(dto, accountNumber, consentId, fiAccountId))
+                .map(dto -> mapToDynamoDbTransaction(dto, accountNumber, consentId, fiAccountId, timestamp, date))
                 .filter(t -> t != null)
                 .collect(Collectors.toList());
     }
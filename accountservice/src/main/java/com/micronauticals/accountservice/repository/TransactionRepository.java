@@ -1,6 +1,8 @@
 package com.micronauticals.accountservice.repository;
 
 import com.micronauticals.accountservice.entity.financialdata.Transaction;
+import jakarta.annotation.PostConstruct;
+import jakarta.annotation.PreDestroy;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
 import org.springframework.beans.factory.annotation.Autowired;
@@ -44,6 +46,8 @@ public class TransactionRepository {
     @Value("${aws.dynamodb.batch.concurrency:10}")
     private int concurrencyLevel;
 
+    private ExecutorService batchWriteExecutor;
+
     @Autowired
     public TransactionRepository(
             DynamoDbEnhancedClient dynamoDbEnhancedClient,
@@ -56,6 +60,39 @@ public class TransactionRepository {
                 tableName, LocalDateTime.now().format(formatter), defaultUserId);
     }
 
+    /**
+     * Create the batch writer pool once; saveAll reuses it instead of building a pool per call
+     */
+    @PostConstruct
+    void initBatchWriteExecutor() {
+        // Use a custom thread factory for better naming and tracking
+        ThreadFactory threadFactory = new ThreadFactory() {
+            private final AtomicInteger threadNumber = new AtomicInteger(1);
+
+            @Override
+            public Thread newThread(Runnable r) {
+                Thread thread = new Thread(r, "DynamoDbBatchWriter-" + threadNumber.getAndIncrement());
+                thread.setDaemon(true); // Don't prevent app shutdown
+                return thread;
+            }
+        };
+
+        batchWriteExecutor = Executors.newFixedThreadPool(concurrencyLevel, threadFactory);
+    }
+
+    @PreDestroy
+    void shutdownBatchWriteExecutor() {
+        batchWriteExecutor.shutdown();
+        try {
+            if (!batchWriteExecutor.awaitTermination(30, TimeUnit.SECONDS)) {
+                batchWriteExecutor.shutdownNow();
+            }
+        } catch (InterruptedException e) {
+            batchWriteExecutor.shutdownNow();
+            Thread.currentThread().interrupt();
+        }
+    }
+
     /**
      * Save a single transaction to DynamoDB
      */
@@ -83,21 +120,6 @@ public class TransactionRepository {
         log.info("Starting parallel batch save of {} transactions using {} threads, user: {}",
                 totalTransactions, concurrencyLevel, defaultUserId);
 
-        // Use a custom thread factory for better naming and tracking
-        ThreadFactory threadFactory = new ThreadFactory() {
-            private final AtomicInteger threadNumber = new AtomicInteger(1);
-
-            @Override
-            public Thread newThread(Runnable r) {
-                Thread thread = new Thread(r, "DynamoDbBatchWriter-" + threadNumber.getAndIncrement());
-                thread.setDaemon(true); // Don't prevent app shutdown
-                return thread;
-            }
-        };
-
-        // Create a fixed thread pool with the configured concurrency level
-        ExecutorService executor = Executors.newFixedThreadPool(concurrencyLevel, threadFactory);
-
         // Split transactions into batches of 25 (DynamoDB limit)
         List<List<Transaction>> batches = new ArrayList<>();
         for (int i = 0; i < transactions.size(); i += batchSize) {
@@ -116,7 +138,7 @@ public class TransactionRepository {
             final int currentBatchNum = batchNum;
             final List<Transaction> currentBatch = batches.get(batchNum);
 
-            futures.add(executor.submit(() -> {
+            futures.add(batchWriteExecutor.submit(() -> {
                 try {
                     processBatch(currentBatch, currentBatchNum + 1, totalBatches);
                     successfulBatches.incrementAndGet();
@@ -142,18 +164,8 @@ public class TransactionRepository {
                     defaultUserId, e);
             Thread.currentThread().interrupt();
         } finally {
-            // Initiate graceful shutdown
-            executor.shutdown();
-            try {
-                // Wait a bit for tasks to complete
-                if (!executor.awaitTermination(30, TimeUnit.SECONDS)) {
-                    // Force shutdown if still running
-                    executor.shutdownNow();
-                }
-            } catch (InterruptedException e) {
-                executor.shutdownNow();
-                Thread.currentThread().interrupt();
-            }
+            // The pool is shared across calls, so only cancel this call's unfinished batches
+            futures.forEach(future -> future.cancel(true));
         }
 
         log.info("Completed parallel batch processing: {}/{} batches successful, {}/{} batches failed, user: {}",
@@ -166,9 +178,8 @@ public class TransactionRepository {
      * Process a single batch of transactions
      */
     private void processBatch(List<Transaction> batch, int batchNum, int totalBatches) {
-        String timestamp = LocalDateTime.now().format(formatter);
-        log.info("Processing batch {}/{} with {} items at {}, user: {}",
-                batchNum, totalBatches, batch.size(), timestamp, defaultUserId);
+        log.debug("Processing batch {}/{} with {} items, user: {}",
+                batchNum, totalBatches, batch.size(), defaultUserId);
 
         // Create a write batch for this chunk
         WriteBatch.Builder<Transaction> writeBuilder = WriteBatch.builder(Transaction.class)
@@ -186,7 +197,7 @@ public class TransactionRepository {
 
         dynamoDbEnhancedClient.batchWriteItem(batchWriteItemEnhancedRequest);
 
-        log.info("Successfully completed batch {}/{} with {} items, user: {}",
+        log.debug("Successfully completed batch {}/{} with {} items, user: {}",
                 batchNum, totalBatches, batch.size(), defaultUserId);
     }
 
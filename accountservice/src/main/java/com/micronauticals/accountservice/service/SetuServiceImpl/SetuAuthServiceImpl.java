@@ -32,8 +32,6 @@ import reactor.core.publisher.Mono;
 import reactor.core.scheduler.Schedulers;
 
 import java.time.Duration;
-import java.time.LocalDateTime;
-import java.time.format.DateTimeFormatter;
 import java.util.List;
 import java.util.Map;
 import java.util.concurrent.CompletableFuture;
@@ -43,7 +41,7 @@ import java.util.concurrent.CompletableFuture;
 @RequiredArgsConstructor
 public class SetuAuthServiceImpl implements SetuAuthService {
 
-    private final WebClient.Builder webClientBuilder;
+    private final WebClient webClient;
     private final ConsentRepository consentRepository;
     private final ConsentDtoToEntity consentDtoToEntity;
     private final FIDataRepository fiDataRepository;
@@ -66,17 +64,17 @@ public class SetuAuthServiceImpl implements SetuAuthService {
 
     private static final String SETU_LOGIN_URL = "https://orgservice-prod.setu.co/v1/users/login";
     private static final String SETU_CONSENT_URL = "https://fiu-sandbox.setu.co/v2/consents";
+    private static final Duration SETU_LOGIN_TIMEOUT = Duration.ofSeconds(10);
     private static final Logger log = LoggerFactory.getLogger(SetuAuthServiceImpl.class);
-    private static final DateTimeFormatter formatter = DateTimeFormatter.ofPattern("yyyy-MM-dd HH:mm:ss");
 
-    private String accessToken;
-    private String refreshToken;
+    // Swapped as one immutable snapshot so concurrent readers never see a mixed token pair
+    private volatile SetuTokens tokens;
+
+    private record SetuTokens(String accessToken, String refreshToken) {}
 
     @Override
     public SetuLoginResponse login() {
         try {
-            WebClient webClient = webClientBuilder.build();
-
             Mono<Map> responseMono = webClient.post()
                     .uri(SETU_LOGIN_URL)
                     .header("client", "bridge")
@@ -100,20 +98,22 @@ public class SetuAuthServiceImpl implements SetuAuthService {
                     })
                     .bodyToMono(Map.class);
 
-            Map<String, Object> result = responseMono.block();
+            Map<String, Object> result = responseMono.block(SETU_LOGIN_TIMEOUT);
 
             if (result == null || !result.containsKey("access_token")) {
                 throw new SetuLoginException("Missing access token in Setu response");
             }
 
-            this.accessToken = (String) result.get("access_token");
-            this.refreshToken = (String) result.get("refresh_token");
+            SetuTokens issued = new SetuTokens(
+                    (String) result.get("access_token"),
+                    (String) result.get("refresh_token"));
+            this.tokens = issued;
 
             log.info("Received access token from Setu");
 
             return SetuLoginResponse.builder()
-                    .accessToken(this.accessToken)
-                    .refreshToken(this.refreshToken)
+                    .accessToken(issued.accessToken())
+                    .refreshToken(issued.refreshToken())
                     .build();
 
         } catch (Exception ex) {
@@ -124,10 +124,10 @@ public class SetuAuthServiceImpl implements SetuAuthService {
 
     @Override
     public Mono<ConsentResponse> createConsent(ConsentRequestDTO requestDTO) {
+        String accessToken = currentAccessToken();
         if (accessToken == null) {
             return Mono.error(new SetuLoginException("Access token not available. Please login first."));
         }
-        WebClient webClient = webClientBuilder.build();
         return webClient.post()
                 .uri(SETU_CONSENT_URL)
                 .header(HttpHeaders.AUTHORIZATION, String.format("Bearer %s",accessToken))
@@ -157,12 +157,11 @@ public class SetuAuthServiceImpl implements SetuAuthService {
 
     @Override
     public Mono<ConsentStatusResponseDTO> getConsentStatus(String consentId, boolean expanded) {
+        String accessToken = currentAccessToken();
         if (accessToken == null) {
             return Mono.error(new SetuLoginException("Access token not available. Please login first."));
         }
 
-        WebClient webClient = webClientBuilder.build();
-
         String url = String.format("https://fiu-sandbox.setu.co/v2/consents/%s?expanded=%s", consentId, expanded);
 
         return webClient.get()
@@ -185,13 +184,12 @@ public class SetuAuthServiceImpl implements SetuAuthService {
 
     @Override
     public Mono<ConsentDataSessionResponseDTO> getDataSessionByConsentId(String consentId){
+        String accessToken = currentAccessToken();
 
         if (accessToken == null) {
             return Mono.error(new SetuLoginException("Access token not available. Please login first."));
         }
 
-        WebClient webClient = webClientBuilder.build();
-
         String url = String.format("https://fiu-sandbox.setu.co/v2/consents/%s/data-sessions",consentId);
 
         return webClient.get()
@@ -221,15 +219,12 @@ public class SetuAuthServiceImpl implements SetuAuthService {
 
     @Override
     public Mono<FIPResponseDTO> getFiData(String sessionId, String authorization) {
-        String timestamp = LocalDateTime.now().format(formatter);
-        log.info("Fetching financial data for session ID: {}, user: {}, timestamp: {}",
-                sessionId, timestamp);
+        log.info("Fetching financial data for session ID: {}", sessionId);
 
         if (authorization == null) {
             return Mono.error(new SetuLoginException("Access token not available. Please login first."));
         }
 
-        WebClient webClient = webClientBuilder.build();
         String url = String.format("https://fiu-sandbox.setu.co/v2/sessions/%s", sessionId);
 
         return webClient.get()
@@ -253,13 +248,13 @@ public class SetuAuthServiceImpl implements SetuAuthService {
 
                         // Step 1: Map DTO to entity and save to PostgreSQL
                         FiDataBundle fiDataBundle = fipResponseDtoToEntityMapper.mapToEntity(response);
-                        log.info(String.valueOf(fiDataBundle));
+                        log.debug("Mapped FiDataBundle: {}", fiDataBundle);
                         FiDataBundle savedBundle = fiDataRepository.save(fiDataBundle);
                         log.info("Saved FiDataBundle with ID: {} to PostgreSQL, user: {}",
                                 savedBundle.getId());
 
                         // Step 2: Extract transactions from the mapper
-                        List<Transaction> transactions = fipResponseDtoToEntityMapper.extractAllTransactions(response.getConsentId());
+                        List<Transaction> transactions = fipResponseDtoToEntityMapper.extractAllTransactions(response);
                         log.info("Extracted {} transactions for DynamoDB storage, user: {}",
                                 transactions.size());
 
@@ -286,7 +281,7 @@ public class SetuAuthServiceImpl implements SetuAuthService {
     }
 
     public Mono<RevokeConsentResponse> revokeConsent(String consentID){
-        WebClient webClient = webClientBuilder.build();
+        String accessToken = currentAccessToken();
         String url = String.format("https://fiu-sandbox.setu.co/v2/consents/%s/revoke",consentID);
         return webClient.post()
                 .uri(url)
@@ -308,11 +303,11 @@ public class SetuAuthServiceImpl implements SetuAuthService {
 
     @Override
     public Mono<DataRefreshPull> refreshDataPull(String sessionID, boolean restart){
+        String accessToken = currentAccessToken();
         String url = restart
                 ? String.format("https://fiu-sandbox.setu.co/v2/sessions/refresh/%s?restart=true",sessionID)
                 : String.format("https://fiu-sandbox.setu.co/v2/sessions/refresh/%s",sessionID);
 
-        WebClient webClient = webClientBuilder.build();
         return webClient.post()
                 .uri(url)
                 .header(HttpHeaders.AUTHORIZATION, String.format("Bearer %s",accessToken))
@@ -331,6 +326,11 @@ public class SetuAuthServiceImpl implements SetuAuthService {
     }
 
 
+    private String currentAccessToken() {
+        SetuTokens current = tokens;
+        return current != null ? current.accessToken() : null;
+    }
+
     private String sanitizeErrorMessage(String errorBody) {
         if (errorBody == null || errorBody.trim().isEmpty()) {
             return "Empty error response";
@@ -9,27 +9,37 @@ import org.springframework.stereotype.Service;
 
 import java.util.ArrayList;
 import java.util.List;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.locks.ReentrantLock;
 
 @Service
 @RequiredArgsConstructor
 public class fiDataBundleConsumer {
     private final List<FiDataBundle> buffer = new ArrayList<>();
+    private final ReentrantLock lock = new ReentrantLock();
     private static final int BATCH_SIZE = 500;
-    private static final long MAX_WAIT_MS = 5000;
-    private long lastFlushTime = System.currentTimeMillis();
+    private static final long MAX_WAIT_NANOS = TimeUnit.MILLISECONDS.toNanos(5000);
+    // Monotonic clock: the flush interval must not jump with wall-clock adjustments
+    private long lastFlushTime = System.nanoTime();
 
     private final FIDataRepository fiDataRepository;
 
     @RabbitListener(queues = RabbitMQConfig.QUEUE_NAME)
-    public synchronized void consume(FiDataBundle fiDataBundle) {
-        buffer.add(fiDataBundle);
-        long now = System.currentTimeMillis();
+    public void consume(FiDataBundle fiDataBundle) {
+        // ReentrantLock rather than synchronized: the blocking saveAll would pin a virtual thread's carrier
+        lock.lock();
+        try {
+            buffer.add(fiDataBundle);
+            long now = System.nanoTime();
 
-        if (buffer.size() >= BATCH_SIZE || now - lastFlushTime >= MAX_WAIT_MS) {
-            List<FiDataBundle> batchToSave = new ArrayList<>(buffer);
-            buffer.clear();
-            lastFlushTime = now;
-            fiDataRepository.saveAll(batchToSave);
+            if (buffer.size() >= BATCH_SIZE || now - lastFlushTime >= MAX_WAIT_NANOS) {
+                List<FiDataBundle> batchToSave = new ArrayList<>(buffer);
+                buffer.clear();
+                lastFlushTime = now;
+                fiDataRepository.saveAll(batchToSave);
+            }
+        } finally {
+            lock.unlock();
         }
     }
 }
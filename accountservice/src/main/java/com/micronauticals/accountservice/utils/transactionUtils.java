@@ -10,7 +10,7 @@ import org.springframework.stereotype.Component;
 @RequiredArgsConstructor
 public class transactionUtils {
 
-    private AmqpTemplate amqpTemplate;
+    private final AmqpTemplate amqpTemplate;
 
     public void saveTransaction(FiDataBundle data) {
         amqpTemplate.convertAndSend(
@@ -22,12 +22,18 @@ import org.springframework.web.cors.CorsConfiguration;
 import org.springframework.web.cors.CorsConfigurationSource;
 import org.springframework.web.cors.UrlBasedCorsConfigurationSource;
 
+import java.nio.charset.StandardCharsets;
 import java.util.List;
 
 @Configuration
 @EnableWebSecurity
 public class SecurityConfig {
 
+    private static final byte[] UNAUTHORIZED_BODY =
+            "{\"error\": \"Unauthorized - Please provide a valid token\"}".getBytes(StandardCharsets.UTF_8);
+    private static final byte[] FORBIDDEN_BODY =
+            "{\"error\": \"Forbidden - You do not have permission to access this resource\"}".getBytes(StandardCharsets.UTF_8);
+
     @Bean
     public SecurityFilterChain filterChain(HttpSecurity http, JwtAuthenticationFilter jwtFilter) throws Exception {
 
@@ -107,7 +113,8 @@ public class SecurityConfig {
         return (request, response, authException) -> {
             response.setStatus(HttpServletResponse.SC_UNAUTHORIZED);
             response.setContentType("application/json");
-            response.getWriter().write("{\"error\": \"Unauthorized - Please provide a valid token\"}");
+            response.setContentLength(UNAUTHORIZED_BODY.length);
+            response.getOutputStream().write(UNAUTHORIZED_BODY);
         };
     }
 
@@ -116,7 +123,8 @@ public class SecurityConfig {
         return (request, response, accessDeniedException) -> {
             response.setStatus(HttpServletResponse.SC_FORBIDDEN);
             response.setContentType("application/json");
-            response.getWriter().write("{\"error\": \"Forbidden - You do not have permission to access this resource\"}");
+            response.setContentLength(FORBIDDEN_BODY.length);
+            response.getOutputStream().write(FORBIDDEN_BODY);
         };
     }
 
@@ -1,10 +1,12 @@
 package com.micronauticals.authservices.filter;
 
 import com.micronauticals.authservices.utils.JwtUtil;
+import io.jsonwebtoken.Claims;
 import jakarta.servlet.FilterChain;
 import jakarta.servlet.ServletException;
 import jakarta.servlet.http.HttpServletRequest;
 import jakarta.servlet.http.HttpServletResponse;
+import lombok.extern.slf4j.Slf4j;
 import org.springframework.security.authentication.UsernamePasswordAuthenticationToken;
 import org.springframework.security.core.authority.SimpleGrantedAuthority;
 import org.springframework.security.core.context.SecurityContextHolder;
@@ -16,6 +18,7 @@ import org.springframework.web.filter.OncePerRequestFilter;
 import java.io.IOException;
 import java.util.List;
 
+@Slf4j
 @Component
 public class JwtAuthenticationFilter extends OncePerRequestFilter {
 
@@ -32,17 +35,19 @@ public class JwtAuthenticationFilter extends OncePerRequestFilter {
             HttpServletRequest request, HttpServletResponse response, FilterChain filterChain) throws ServletException, IOException{
 
         String authHeader = request.getHeader("Authorization");
-        String token = null, username = null;
+        Claims claims = null;
+        String username = null;
 
         if(authHeader != null && authHeader.startsWith("Bearer ")){
-            token = authHeader.substring(7);
-            username = jwtUtil.getUsernameFromToken(token);
+            // Parse and verify the token once; subject, expiry and role all come from the same claims
+            claims = jwtUtil.extractAllClaims(authHeader.substring(7));
+            username = claims.getSubject();
         }
         if(username != null && SecurityContextHolder.getContext().getAuthentication() == null){
             var userDetails = userDetailsService.loadUserByUsername(username);
             try {
-                if (jwtUtil.validateToken(token)) {
-                    String role = jwtUtil.getRoleFromToken(token);
+                if (jwtUtil.validateClaims(claims)) {
+                    String role = claims.get("role", String.class);
                     List<SimpleGrantedAuthority> authorities = List.of(new SimpleGrantedAuthority(role));
                     UsernamePasswordAuthenticationToken auth =
                             new UsernamePasswordAuthenticationToken(userDetails, null, authorities);
@@ -50,7 +55,7 @@ public class JwtAuthenticationFilter extends OncePerRequestFilter {
                     SecurityContextHolder.getContext().setAuthentication(auth);
                 }
             }catch (Exception e) {
-                System.out.println("User not found for token username: " + username);
+                log.warn("User not found for token username: {}", username);
             }
         }
         filterChain.doFilter(request, response);
@@ -8,6 +8,7 @@ import com.micronauticals.authservices.exception.UserAlreadyExistsException;
 import com.micronauticals.authservices.repository.UserRepository;
 import com.micronauticals.authservices.service.UserService;
 import com.micronauticals.authservices.utils.JwtUtil;
+import io.jsonwebtoken.Claims;
 import lombok.RequiredArgsConstructor;
 import lombok.extern.slf4j.Slf4j;
 import org.springframework.security.authentication.AuthenticationManager;
@@ -103,13 +104,14 @@ public class UserServiceImpl implements UserService {
     public AuthResponse refreshToken(String refreshToken) {
         try {
             // First validate the token structure and signature
-            if (!jwtUtil.validateToken(refreshToken)) {
+            Claims claims = jwtUtil.extractAllClaims(refreshToken);
+            if (!jwtUtil.validateClaims(claims)) {
                 log.error("Invalid refresh token provided");
                 throw new com.micronauticals.authservices.exception.AuthenticationException("Invalid refresh token");
             }
 
             // Extract username from the token
-            String username = jwtUtil.getUsernameFromToken(refreshToken);
+            String username = claims.getSubject();
 
             if (username == null || username.trim().isEmpty()) {
                 log.error("Refresh token contains empty or null username");
@@ -237,12 +239,13 @@ public class UserServiceImpl implements UserService {
 
     @Override
     public Map<String, Object> verifyTokenForInternalService(String token) {
-        if (!jwtUtil.validateToken(token)) {
+        Claims claims = jwtUtil.extractAllClaims(token);
+        if (!jwtUtil.validateClaims(claims)) {
             throw new com.micronauticals.authservices.exception.AuthenticationException("Invalid token");
         }
 
-        String username = jwtUtil.getUsernameFromToken(token);
-        String role = jwtUtil.getRoleFromToken(token);
+        String username = claims.getSubject();
+        String role = claims.get("role", String.class);
 
         Map<String, Object> result = new HashMap<>();
         result.put("valid", true);
@@ -1,9 +1,11 @@
 package com.micronauticals.authservices.utils;
 
 import io.jsonwebtoken.Claims;
+import io.jsonwebtoken.JwtParser;
 import io.jsonwebtoken.Jwts;
 import io.jsonwebtoken.io.Decoders;
 import io.jsonwebtoken.security.Keys;
+import jakarta.annotation.PostConstruct;
 import org.springframework.beans.factory.annotation.Value;
 import org.springframework.stereotype.Component;
 
@@ -26,9 +28,16 @@ public class JwtUtil {
     @Value("${app.jwt.expiration}")
     private long expirationTime;
 
-    private SecretKey getSigningKey(){
+    private SecretKey signingKey;
+    private JwtParser jwtParser;
+
+    @PostConstruct
+    void init(){
         byte[] keyBytes = Decoders.BASE64.decode(secretKey);
-        return Keys.hmacShaKeyFor(keyBytes);
+        this.signingKey = Keys.hmacShaKeyFor(keyBytes);
+        this.jwtParser = Jwts.parser()
+                .verifyWith(signingKey)
+                .build();
     }
 
     private String createToken(Map<String, Object> claims, String subject, long expirationTime ){
@@ -39,14 +48,12 @@ public class JwtUtil {
                 .and()
                 .issuedAt(new Date(System.currentTimeMillis()))
                 .expiration(new Date(System.currentTimeMillis() + expirationTime))
-                .signWith(getSigningKey())
+                .signWith(signingKey)
                 .compact();
     }
 
-    private Claims extractAllClaims(String token){
-        return Jwts.parser()
-                .verifyWith(getSigningKey())
-                .build()
+    public Claims extractAllClaims(String token){
+        return jwtParser
                 .parseSignedClaims(token)
                 .getPayload();
     }
@@ -63,24 +70,12 @@ public class JwtUtil {
         return createToken(claims,username,refreshTokenValidity);
     }
 
-    public String getUsernameFromToken(String token){
-        return extractAllClaims(token).getSubject();
-    }
-
-    public Date getExpiration(String token){
-        return extractAllClaims(token).getExpiration();
-    }
-
-    private Boolean isTokenExpired(String token){
-        return getExpiration(token).before(new Date());
-    }
-
     public Boolean validateToken(String token) {
-        return !isTokenExpired(token);
+        return validateClaims(extractAllClaims(token));
     }
 
-    public String getRoleFromToken(String token) {
-        return extractAllClaims(token).get("role", String.class);
+    public Boolean validateClaims(Claims claims) {
+        return !claims.getExpiration().before(new Date());
     }
 
 }
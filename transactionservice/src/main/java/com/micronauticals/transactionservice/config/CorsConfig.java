@@ -15,8 +15,14 @@ public class CorsConfig {
                 registry.addMapping("/**")
                         .allowedOrigins("http://localhost:5173")
                         .allowedMethods("GET", "POST", "PUT", "DELETE", "OPTIONS")
-                        .allowedHeaders("*")
-                        .allowCredentials(true);
+                        .allowedHeaders("Authorization", "Content-Type", "X-Requested-With",
+                                "Accept", "Origin", "Access-Control-Request-Method",
+                                "Access-Control-Request-Headers", "x-product-instance-id",
+                                "If-None-Match")
+                        // Let cross-origin clients read the ETag so they can send it back in If-None-Match
+                        .exposedHeaders("ETag")
+                        .allowCredentials(true)
+                        .maxAge(3600);
             }
         };
     }
@@ -0,0 +1,28 @@
+package com.micronauticals.transactionservice.config;
+
+import org.springframework.boot.web.servlet.FilterRegistrationBean;
+import org.springframework.context.annotation.Bean;
+import org.springframework.context.annotation.Configuration;
+import org.springframework.web.filter.ShallowEtagHeaderFilter;
+
+/**
+ * Adds ETag / If-None-Match handling to the read-only transaction lookups so
+ * clients that re-poll an unchanged consent or account receive a bodiless 304.
+ */
+@Configuration
+public class EtagConfig {
+
+    @Bean
+    public FilterRegistrationBean<ShallowEtagHeaderFilter> shallowEtagHeaderFilter() {
+        ShallowEtagHeaderFilter filter = new ShallowEtagHeaderFilter();
+        // Tomcat skips compression for responses with a strong ETag; a weak one keeps gzip working
+        filter.setWriteWeakETag(true);
+        FilterRegistrationBean<ShallowEtagHeaderFilter> registration = new FilterRegistrationBean<>(filter);
+        registration.addUrlPatterns(
+                "/api/setu/transaction/byConsentID",
+                "/api/setu/transaction/accountNumber"
+        );
+        registration.setName("shallowEtagHeaderFilter");
+        return registration;
+    }
+}
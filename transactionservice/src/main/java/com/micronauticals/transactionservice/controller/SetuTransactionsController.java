@@ -1,6 +1,8 @@
 package com.micronauticals.transactionservice.controller;
 
 import com.micronauticals.transactionservice.dto.FIPResponseDTO;
+import com.micronauticals.transactionservice.dto.IngestDataResponse;
+import com.micronauticals.transactionservice.dto.TransactionPageResponse;
 import com.micronauticals.transactionservice.entity.financialdata.Transaction;
 import com.micronauticals.transactionservice.repository.TransactionRepository;
 import com.micronauticals.transactionservice.service.TransactionService;
@@ -10,11 +12,13 @@ import org.springframework.http.HttpStatus;
 import org.springframework.http.ResponseEntity;
 import org.springframework.web.bind.annotation.*;
 import reactor.core.publisher.Mono;
+import software.amazon.awssdk.enhanced.dynamodb.model.Page;
+import software.amazon.awssdk.services.dynamodb.model.AttributeValue;
 
+import java.nio.charset.StandardCharsets;
 import java.time.LocalDateTime;
-import java.util.HashMap;
+import java.util.Base64;
 import java.util.List;
-import java.util.Map;
 
 @RestController
 @Slf4j
@@ -22,6 +26,8 @@ import java.util.Map;
 @RequiredArgsConstructor
 public class SetuTransactionsController {
 
+    private static final int MAX_PAGE_SIZE = 100;
+
     private final TransactionService transactionService;
     private final TransactionRepository transactionRepository;
 
@@ -32,20 +38,49 @@ public class SetuTransactionsController {
         return ResponseEntity.ok(transactions);
     }
 
+    /**
+     * Cursor-paginated variant of byConsentID. Pass the returned nextCursor to fetch the
+     * following page; a null nextCursor means there are no more results.
+     */
+    @GetMapping("/byConsentID/page")
+    public ResponseEntity<TransactionPageResponse> getTransactionPageByConsentId(
+            @RequestParam String consentId,
+            @RequestParam(defaultValue = "50") int limit,
+            @RequestParam(required = false) String cursor) {
+
+        String exclusiveStartSk;
+        try {
+            exclusiveStartSk = cursor != null
+                    ? new String(Base64.getUrlDecoder().decode(cursor), StandardCharsets.UTF_8)
+                    : null;
+        } catch (IllegalArgumentException e) {
+            log.warn("Invalid pagination cursor for consent ID: {}", consentId);
+            return ResponseEntity.badRequest().build();
+        }
+
+        int pageSize = Math.max(1, Math.min(limit, MAX_PAGE_SIZE));
+        Page<Transaction> page = transactionRepository.findPageByConsentId(consentId, pageSize, exclusiveStartSk);
+
+        AttributeValue lastSk = page.lastEvaluatedKey() != null ? page.lastEvaluatedKey().get("sk") : null;
+        String nextCursor = lastSk != null
+                ? Base64.getUrlEncoder().withoutPadding().encodeToString(lastSk.s().getBytes(StandardCharsets.UTF_8))
+                : null;
+
+        return ResponseEntity.ok(TransactionPageResponse.builder()
+                .transactions(page.items())
+                .nextCursor(nextCursor)
+                .build());
+    }
+
     @GetMapping("/{consentId}/ingestData")
-    public Mono<ResponseEntity<Map<String, Object>>> ingestTransactionsByConsentId(@PathVariable String consentId) {
+    public Mono<ResponseEntity<IngestDataResponse>> ingestTransactionsByConsentId(@PathVariable String consentId) {
         log.info("Ingesting transactions to RAG for consent ID: {}", consentId);
         List<Transaction> transactions = transactionRepository.findByConsentId(consentId);
 
         if (transactions.isEmpty()) {
             log.warn("No transactions found for consentId: {}", consentId);
-            Map<String, Object> response = new HashMap<>();
-            response.put("status", "error");
-            response.put("message", "No transactions found for consentId: " + consentId);
-            response.put("consentId", consentId);
-            response.put("transactionsIngested", 0);
-            response.put("timestamp", LocalDateTime.now().toString());
-            return Mono.just(ResponseEntity.ok(response));
+            return Mono.just(ResponseEntity.ok(ingestResponse(
+                    "error", "No transactions found for consentId: " + consentId, consentId, 0)));
         }
 
         log.info("Found {} transactions, sending to RAG service...", transactions.size());
@@ -53,25 +88,15 @@ public class SetuTransactionsController {
         // Wait for RAG service call to complete and return result
         return transactionService.sendTransactionsToRagService(transactions)
                 .then(Mono.fromCallable(() -> {
-                    Map<String, Object> response = new HashMap<>();
-                    response.put("status", "success");
-                    response.put("message", "Successfully ingested transactions to RAG service");
-                    response.put("consentId", consentId);
-                    response.put("transactionsIngested", transactions.size());
-                    response.put("timestamp", LocalDateTime.now().toString());
                     log.info("✅ Successfully sent {} transactions to RAG service for consentId: {}", transactions.size(), consentId);
-                    return ResponseEntity.ok(response);
+                    return ResponseEntity.ok(ingestResponse(
+                            "success", "Successfully ingested transactions to RAG service", consentId, transactions.size()));
                 }))
                 .onErrorResume(error -> {
                     log.error("❌ Failed to send transactions to RAG service for consentId: {}, error: {}",
                             consentId, error.getMessage(), error);
-                    Map<String, Object> response = new HashMap<>();
-                    response.put("status", "error");
-                    response.put("message", "Failed to ingest transactions: " + error.getMessage());
-                    response.put("consentId", consentId);
-                    response.put("transactionsIngested", 0);
-                    response.put("timestamp", LocalDateTime.now().toString());
-                    return Mono.just(ResponseEntity.status(HttpStatus.INTERNAL_SERVER_ERROR).body(response));
+                    return Mono.just(ResponseEntity.status(HttpStatus.INTERNAL_SERVER_ERROR).body(ingestResponse(
+                            "error", "Failed to ingest transactions: " + error.getMessage(), consentId, 0)));
                 });
     }
 
@@ -113,8 +138,19 @@ public class SetuTransactionsController {
     public ResponseEntity<?> deleteTransactionByTransactionId(@RequestParam String accountNumber,
                                                               @RequestParam String transactionId) {
         log.info("Deleting transaction with transaction ID: {} ", transactionId);
-        transactionRepository.deleteById(accountNumber, transactionId);
+        if (!transactionRepository.deleteById(accountNumber, transactionId)) {
+            return ResponseEntity.notFound().build();
+        }
         return ResponseEntity.noContent().build();
     }
-}
 
+    private static IngestDataResponse ingestResponse(String status, String message, String consentId, int ingested) {
+        return IngestDataResponse.builder()
+                .status(status)
+                .message(message)
+                .consentId(consentId)
+                .transactionsIngested(ingested)
+                .timestamp(LocalDateTime.now().toString())
+                .build();
+    }
+}
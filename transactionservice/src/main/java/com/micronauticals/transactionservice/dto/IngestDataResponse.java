@@ -0,0 +1,18 @@
+package com.micronauticals.transactionservice.dto;
+
+import lombok.AllArgsConstructor;
+import lombok.Builder;
+import lombok.Data;
+import lombok.NoArgsConstructor;
+
+@Data
+@Builder
+@NoArgsConstructor
+@AllArgsConstructor
+public class IngestDataResponse {
+    private String status;
+    private String message;
+    private String consentId;
+    private int transactionsIngested;
+    private String timestamp;
+}
@@ -0,0 +1,18 @@
+package com.micronauticals.transactionservice.dto;
+
+import com.micronauticals.transactionservice.entity.financialdata.Transaction;
+import lombok.AllArgsConstructor;
+import lombok.Builder;
+import lombok.Data;
+import lombok.NoArgsConstructor;
+
+import java.util.List;
+
+@Data
+@Builder
+@NoArgsConstructor
+@AllArgsConstructor
+public class TransactionPageResponse {
+    private List<Transaction> transactions;
+    private String nextCursor;
+}
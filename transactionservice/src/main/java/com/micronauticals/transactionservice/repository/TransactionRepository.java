@@ -1,6 +1,8 @@
 package com.micronauticals.transactionservice.repository;
 
 import com.micronauticals.transactionservice.entity.financialdata.Transaction;
+import jakarta.annotation.PostConstruct;
+import jakarta.annotation.PreDestroy;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
 import org.springframework.beans.factory.annotation.Autowired;
@@ -9,6 +11,7 @@ import org.springframework.stereotype.Repository;
 import software.amazon.awssdk.core.pagination.sync.SdkIterable;
 import software.amazon.awssdk.enhanced.dynamodb.*;
 import software.amazon.awssdk.enhanced.dynamodb.model.*;
+import software.amazon.awssdk.services.dynamodb.model.AttributeValue;
 
 import java.time.LocalDateTime;
 import java.time.format.DateTimeFormatter;
@@ -25,6 +28,8 @@ import java.util.concurrent.atomic.AtomicInteger;
 public class TransactionRepository {
 
     private static final Logger log = LoggerFactory.getLogger(TransactionRepository.class);
+    private static final int MAX_DELETE_RETRIES = 5;
+    private static final long DELETE_RETRY_BASE_DELAY_MS = 100;
     private final DynamoDbEnhancedClient dynamoDbEnhancedClient;
     private final DynamoDbTable<Transaction> transactionTable;
     private final DateTimeFormatter formatter = DateTimeFormatter.ofPattern("yyyy-MM-dd HH:mm:ss");
@@ -36,6 +41,8 @@ public class TransactionRepository {
     @Value("${aws.dynamodb.batch.concurrency:10}")
     private int concurrencyLevel;
 
+    private ExecutorService batchWriteExecutor;
+
     @Autowired
     public TransactionRepository(
             DynamoDbEnhancedClient dynamoDbEnhancedClient,
@@ -48,6 +55,38 @@ public class TransactionRepository {
                 tableName, LocalDateTime.now().format(formatter), defaultUserId);
     }
 
+    /**
+     * Create the batch writer pool once; saveAll reuses it instead of building a pool per call
+     */
+    @PostConstruct
+    void initBatchWriteExecutor() {
+        ThreadFactory threadFactory = new ThreadFactory() {
+            private final AtomicInteger threadNumber = new AtomicInteger(1);
+
+            @Override
+            public Thread newThread(Runnable r) {
+                Thread thread = new Thread(r, "DynamoDbBatchWriter-" + threadNumber.getAndIncrement());
+                thread.setDaemon(true);
+                return thread;
+            }
+        };
+
+        batchWriteExecutor = Executors.newFixedThreadPool(concurrencyLevel, threadFactory);
+    }
+
+    @PreDestroy
+    void shutdownBatchWriteExecutor() {
+        batchWriteExecutor.shutdown();
+        try {
+            if (!batchWriteExecutor.awaitTermination(30, TimeUnit.SECONDS)) {
+                batchWriteExecutor.shutdownNow();
+            }
+        } catch (InterruptedException e) {
+            batchWriteExecutor.shutdownNow();
+            Thread.currentThread().interrupt();
+        }
+    }
+
     /**
      * Save a single transaction to DynamoDB
      */
@@ -75,19 +114,6 @@ public class TransactionRepository {
         log.info("Starting parallel batch save of {} transactions using {} threads, user: {}",
                 totalTransactions, concurrencyLevel, defaultUserId);
 
-        ThreadFactory threadFactory = new ThreadFactory() {
-            private final AtomicInteger threadNumber = new AtomicInteger(1);
-
-            @Override
-            public Thread newThread(Runnable r) {
-                Thread thread = new Thread(r, "DynamoDbBatchWriter-" + threadNumber.getAndIncrement());
-                thread.setDaemon(true);
-                return thread;
-            }
-        };
-
-        ExecutorService executor = Executors.newFixedThreadPool(concurrencyLevel, threadFactory);
-
         List<List<Transaction>> batches = new ArrayList<>();
         for (int i = 0; i < transactions.size(); i += batchSize) {
             int endIndex = Math.min(i + batchSize, transactions.size());
@@ -103,7 +129,7 @@ public class TransactionRepository {
             final int currentBatchNum = batchNum;
             final List<Transaction> currentBatch = batches.get(batchNum);
 
-            futures.add(executor.submit(() -> {
+            futures.add(batchWriteExecutor.submit(() -> {
                 try {
                     processBatch(currentBatch, currentBatchNum + 1, totalBatches);
                     successfulBatches.incrementAndGet();
@@ -128,15 +154,8 @@ public class TransactionRepository {
                     defaultUserId, e);
             Thread.currentThread().interrupt();
         } finally {
-            executor.shutdown();
-            try {
-                if (!executor.awaitTermination(30, TimeUnit.SECONDS)) {
-                    executor.shutdownNow();
-                }
-            } catch (InterruptedException e) {
-                executor.shutdownNow();
-                Thread.currentThread().interrupt();
-            }
+            // The pool is shared across calls, so only cancel this call's unfinished batches
+            futures.forEach(future -> future.cancel(true));
         }
 
         log.info("Completed parallel batch processing: {}/{} batches successful, {}/{} batches failed, user: {}",
@@ -149,9 +168,8 @@ public class TransactionRepository {
      * Process a single batch of transactions
      */
     private void processBatch(List<Transaction> batch, int batchNum, int totalBatches) {
-        String timestamp = LocalDateTime.now().format(formatter);
-        log.info("Processing batch {}/{} with {} items at {}, user: {}",
-                batchNum, totalBatches, batch.size(), timestamp, defaultUserId);
+        log.debug("Processing batch {}/{} with {} items, user: {}",
+                batchNum, totalBatches, batch.size(), defaultUserId);
 
         WriteBatch.Builder<Transaction> writeBuilder = WriteBatch.builder(Transaction.class)
                 .mappedTableResource(transactionTable);
@@ -166,7 +184,7 @@ public class TransactionRepository {
 
         dynamoDbEnhancedClient.batchWriteItem(batchWriteItemEnhancedRequest);
 
-        log.info("Successfully completed batch {}/{} with {} items, user: {}",
+        log.debug("Successfully completed batch {}/{} with {} items, user: {}",
                 batchNum, totalBatches, batch.size(), defaultUserId);
     }
 
@@ -174,15 +192,24 @@ public class TransactionRepository {
      * Find a transaction by account number and transaction ID
      */
     public Optional<Transaction> findById(String accountNumber, String transactionId) {
-        Key key = Key.builder()
-                .partitionValue("ACCOUNT#" + accountNumber)
-                .sortValue("TXN#" + transactionId)
-                .build();
-
         log.info("Finding transaction {} for account {}, user: {}",
                 transactionId, accountNumber, defaultUserId);
 
-        return Optional.ofNullable(transactionTable.getItem(key));
+        // The table is keyed by consent and timestamp, so locate the item through the account GSI;
+        // pages are fetched lazily and the query stops at the first match
+        QueryEnhancedRequest request = QueryEnhancedRequest.builder()
+                .queryConditional(QueryConditional.keyEqualTo(Key.builder()
+                        .partitionValue("ACCOUNT#" + accountNumber)
+                        .build()))
+                .filterExpression(Expression.builder()
+                        .expression("txnId = :txnId")
+                        .putExpressionValue(":txnId", AttributeValue.builder().s(transactionId).build())
+                        .build())
+                .build();
+
+        return transactionTable.index("pk_GSI_3-sk_GSI_3-index").query(request).stream()
+                .flatMap(page -> page.items().stream())
+                .findFirst();
     }
 
     /**
@@ -237,6 +264,31 @@ public class TransactionRepository {
         return allTransactions;
     }
 
+    /**
+     * Fetch a single page of transactions for a consent ID using keyset pagination.
+     * Resumes after the given sort key instead of re-reading earlier pages.
+     */
+    public Page<Transaction> findPageByConsentId(String consentId, int limit, String exclusiveStartSk) {
+        log.info("Finding page of up to {} transactions for consent {}, user: {}",
+                limit, consentId, defaultUserId);
+
+        String partitionKey = "CONSENTID#" + consentId;
+
+        QueryEnhancedRequest.Builder request = QueryEnhancedRequest.builder()
+                .queryConditional(QueryConditional.keyEqualTo(Key.builder()
+                        .partitionValue(partitionKey)
+                        .build()))
+                .limit(limit);
+
+        if (exclusiveStartSk != null) {
+            request.exclusiveStartKey(Map.of(
+                    "pk", AttributeValue.builder().s(partitionKey).build(),
+                    "sk", AttributeValue.builder().s(exclusiveStartSk).build()));
+        }
+
+        return transactionTable.query(request.build()).iterator().next();
+    }
+
     /**
      * Find all transactions for a specific FiAccount ID
      */
@@ -262,17 +314,16 @@ public class TransactionRepository {
 
     /**
      * Delete a transaction by account number and transaction ID
+     * Returns false when no match is found; the account GSI is eventually consistent,
+     * so a freshly ingested transaction may not be visible yet
      */
-    public void deleteById(String accountNumber, String transactionId) {
-        Key key = Key.builder()
-                .partitionValue("ACCOUNT#" + accountNumber)
-                .sortValue("TXN#" + transactionId)
-                .build();
-
+    public boolean deleteById(String accountNumber, String transactionId) {
         log.info("Deleting transaction {} for account {}, user: {}",
                 transactionId, accountNumber, defaultUserId);
 
-        transactionTable.deleteItem(key);
+        Optional<Transaction> transaction = findById(accountNumber, transactionId);
+        transaction.ifPresent(transactionTable::deleteItem);
+        return transaction.isPresent();
     }
 
     /**
@@ -283,14 +334,56 @@ public class TransactionRepository {
                 accountNumber, defaultUserId);
 
         List<Transaction> transactions = findByAccountNumber(accountNumber);
-        for (Transaction txn : transactions) {
-            deleteById(accountNumber, txn.getTxnId());
+
+        final int batchSize = 25; // DynamoDB BatchWriteItem limit
+        for (int i = 0; i < transactions.size(); i += batchSize) {
+            WriteBatch.Builder<Transaction> writeBuilder = WriteBatch.builder(Transaction.class)
+                    .mappedTableResource(transactionTable);
+
+            for (Transaction txn : transactions.subList(i, Math.min(i + batchSize, transactions.size()))) {
+                writeBuilder.addDeleteItem(txn);
+            }
+
+            BatchWriteResult result = dynamoDbEnhancedClient.batchWriteItem(BatchWriteItemEnhancedRequest.builder()
+                    .writeBatches(writeBuilder.build())
+                    .build());
+            retryUnprocessedDeletes(result.unprocessedDeleteItemsForTable(transactionTable), accountNumber);
         }
 
         log.info("Deleted {} transactions for account {}",
                 transactions.size(), accountNumber);
     }
 
+    /**
+     * Resubmit deletes DynamoDB left unprocessed (e.g. throttled) with exponential backoff
+     */
+    private void retryUnprocessedDeletes(List<Key> unprocessed, String accountNumber) {
+        for (int attempt = 1; !unprocessed.isEmpty(); attempt++) {
+            if (attempt > MAX_DELETE_RETRIES) {
+                throw new RuntimeException(String.format(
+                        "Failed to delete %d transactions for account %s after %d retries",
+                        unprocessed.size(), accountNumber, MAX_DELETE_RETRIES));
+            }
+            log.warn("Retrying {} unprocessed deletes for account {} (attempt {}/{})",
+                    unprocessed.size(), accountNumber, attempt, MAX_DELETE_RETRIES);
+            try {
+                Thread.sleep(DELETE_RETRY_BASE_DELAY_MS << (attempt - 1));
+            } catch (InterruptedException e) {
+                Thread.currentThread().interrupt();
+                throw new RuntimeException("Interrupted while deleting transactions for account " + accountNumber, e);
+            }
+
+            WriteBatch.Builder<Transaction> retryBuilder = WriteBatch.builder(Transaction.class)
+                    .mappedTableResource(transactionTable);
+            unprocessed.forEach(retryBuilder::addDeleteItem);
+
+            unprocessed = dynamoDbEnhancedClient.batchWriteItem(BatchWriteItemEnhancedRequest.builder()
+                    .writeBatches(retryBuilder.build())
+                    .build())
+                    .unprocessedDeleteItemsForTable(transactionTable);
+        }
+    }
+
     /**
      * Count all transactions in the table
      */
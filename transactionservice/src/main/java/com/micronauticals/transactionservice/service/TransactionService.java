@@ -18,8 +18,6 @@ import org.springframework.web.reactive.function.client.WebClient;
 import reactor.core.publisher.Mono;
 import reactor.core.scheduler.Schedulers;
 
-import java.time.LocalDateTime;
-import java.time.format.DateTimeFormatter;
 import java.util.List;
 import java.util.Map;
 
@@ -33,21 +31,17 @@ public class TransactionService implements com.micronauticals.transactionservice
     private final FIDataRepository fiDataRepository;
     private final FIPResponseDtoToEntityMapper fipResponseDtoToEntityMapper;
     private final TransactionRepository transactionRepository;
-    private final WebClient.Builder webClientBuilder;
-    private static final DateTimeFormatter formatter = DateTimeFormatter.ofPattern("yyyy-MM-dd HH:mm:ss");
+    private final WebClient webClient;
     private static final String RAG_SERVICE_URL = "http://localhost:9000/ingest";
 
     @Override
     public Mono<FIPResponseDTO> getFiData(String sessionId, String authorization) {
-        String timestamp = LocalDateTime.now().format(formatter);
-        log.info("Fetching financial data for session ID: {}, user: {}, timestamp: {}",
-                sessionId, timestamp);
+        log.info("Fetching financial data for session ID: {}", sessionId);
 
         if (authorization == null) {
             return Mono.error(new SetuLoginException("Access token not available. Please login first."));
         }
 
-        WebClient webClient = webClientBuilder.build();
         String url = String.format("https://fiu-sandbox.setu.co/v2/sessions/%s", sessionId);
 
         return webClient.get()
@@ -76,7 +70,7 @@ public class TransactionService implements com.micronauticals.transactionservice
                                 savedBundle.getId());
 
                         // Step 2: Extract transactions from the mapper
-                        List<Transaction> transactions = fipResponseDtoToEntityMapper.extractAllTransactions(response.getConsentId());
+                        List<Transaction> transactions = fipResponseDtoToEntityMapper.extractAllTransactions(response);
                         log.info("Extracted {} transactions for DynamoDB storage, user: {}",
                                 transactions.size());
 
@@ -111,8 +105,6 @@ public class TransactionService implements com.micronauticals.transactionservice
     public Mono<Void> sendTransactionsToRagService(List<Transaction> transactions) {
         log.info("⚡ sendTransactionsToRagService called with {} transactions", transactions.size());
 
-        WebClient webClient = webClientBuilder.build();
-        
         // Wrap transactions in the required format
         Map<String, List<Transaction>> requestBody = Map.of("context_data", transactions);
 
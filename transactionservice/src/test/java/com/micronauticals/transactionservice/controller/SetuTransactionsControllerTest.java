@@ -0,0 +1,84 @@
+package com.micronauticals.transactionservice.controller;
+
+import com.micronauticals.transactionservice.dto.TransactionPageResponse;
+import com.micronauticals.transactionservice.entity.financialdata.Transaction;
+import com.micronauticals.transactionservice.repository.TransactionRepository;
+import com.micronauticals.transactionservice.service.TransactionService;
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.extension.ExtendWith;
+import org.mockito.InjectMocks;
+import org.mockito.Mock;
+import org.mockito.junit.jupiter.MockitoExtension;
+import org.springframework.http.HttpStatus;
+import org.springframework.http.ResponseEntity;
+import software.amazon.awssdk.enhanced.dynamodb.model.Page;
+import software.amazon.awssdk.services.dynamodb.model.AttributeValue;
+
+import java.util.List;
+import java.util.Map;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.mockito.ArgumentMatchers.any;
+import static org.mockito.ArgumentMatchers.anyInt;
+import static org.mockito.ArgumentMatchers.anyString;
+import static org.mockito.Mockito.verify;
+import static org.mockito.Mockito.verifyNoInteractions;
+import static org.mockito.Mockito.when;
+
+@ExtendWith(MockitoExtension.class)
+class SetuTransactionsControllerTest {
+
+    @Mock
+    private TransactionService transactionService;
+
+    @Mock
+    private TransactionRepository transactionRepository;
+
+    @InjectMocks
+    private SetuTransactionsController controller;
+
+    @Test
+    void nextCursorRoundTripsAsTheExclusiveStartKey() {
+        String lastSk = "ACCOUNT#ACC-1#TIMESTP#2024-01-01T10:00:00+05:30";
+        when(transactionRepository.findPageByConsentId("consent-1", 50, null))
+                .thenReturn(Page.create(
+                        List.of(Transaction.builder().txnId("T1").build()),
+                        Map.of("pk", AttributeValue.builder().s("CONSENTID#consent-1").build(),
+                                "sk", AttributeValue.builder().s(lastSk).build())));
+        when(transactionRepository.findPageByConsentId("consent-1", 50, lastSk))
+                .thenReturn(Page.create(List.of(Transaction.builder().txnId("T2").build())));
+
+        ResponseEntity<TransactionPageResponse> first =
+                controller.getTransactionPageByConsentId("consent-1", 50, null);
+        String cursor = first.getBody().getNextCursor();
+        assertThat(cursor).isNotNull();
+
+        ResponseEntity<TransactionPageResponse> second =
+                controller.getTransactionPageByConsentId("consent-1", 50, cursor);
+
+        assertThat(second.getStatusCode()).isEqualTo(HttpStatus.OK);
+        assertThat(second.getBody().getTransactions()).extracting(Transaction::getTxnId).containsExactly("T2");
+        assertThat(second.getBody().getNextCursor()).isNull();
+    }
+
+    @Test
+    void limitIsClampedToTheAllowedPageSize() {
+        when(transactionRepository.findPageByConsentId(anyString(), anyInt(), any()))
+                .thenReturn(Page.create(List.of()));
+
+        controller.getTransactionPageByConsentId("consent-1", 500, null);
+        controller.getTransactionPageByConsentId("consent-1", 0, null);
+
+        verify(transactionRepository).findPageByConsentId("consent-1", 100, null);
+        verify(transactionRepository).findPageByConsentId("consent-1", 1, null);
+    }
+
+    @Test
+    void malformedCursorReturnsBadRequest() {
+        ResponseEntity<TransactionPageResponse> response =
+                controller.getTransactionPageByConsentId("consent-1", 50, "not*base64");
+
+        assertThat(response.getStatusCode()).isEqualTo(HttpStatus.BAD_REQUEST);
+        verifyNoInteractions(transactionRepository);
+    }
+}
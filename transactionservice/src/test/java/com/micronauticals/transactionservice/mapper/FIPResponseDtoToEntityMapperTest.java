@@ -0,0 +1,79 @@
+package com.micronauticals.transactionservice.mapper;
+
+import com.micronauticals.transactionservice.dto.FIPResponseDTO;
+import com.micronauticals.transactionservice.entity.financialdata.Transaction;
+import org.junit.jupiter.api.Test;
+
+import java.util.List;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+class FIPResponseDtoToEntityMapperTest {
+
+    private final FIPResponseDtoToEntityMapper mapper = new FIPResponseDtoToEntityMapper(new TransactionMapper());
+
+    @Test
+    void extractAllTransactionsGroupsByAccountAndSkipsAccountsWithoutData() {
+        FIPResponseDTO dto = response("consent-1",
+                account("ACC-1", txn("T1"), txn("T2")),
+                FIPResponseDTO.Fip.Account.builder().linkRefNumber("ACC-2").build());
+
+        List<Transaction> transactions = mapper.extractAllTransactions(dto);
+
+        assertThat(transactions).extracting(Transaction::getTxnId).containsExactly("T1", "T2");
+        assertThat(transactions).extracting(Transaction::getAccountNumber).containsOnly("ACC-1");
+        assertThat(transactions).extracting(Transaction::getConsentId).containsOnly("consent-1");
+    }
+
+    @Test
+    void extractAllTransactionsDoesNotCarryStateBetweenCalls() {
+        FIPResponseDTO first = response("consent-1", account("ACC-1", txn("T1")));
+        FIPResponseDTO second = response("consent-2", account("ACC-2", txn("T2")));
+
+        // Interleave the two requests the way concurrent ingests would
+        mapper.mapToEntity(first);
+        mapper.mapToEntity(second);
+        List<Transaction> firstTransactions = mapper.extractAllTransactions(first);
+        List<Transaction> secondTransactions = mapper.extractAllTransactions(second);
+
+        assertThat(firstTransactions).extracting(Transaction::getTxnId).containsExactly("T1");
+        assertThat(firstTransactions).extracting(Transaction::getConsentId).containsOnly("consent-1");
+        assertThat(secondTransactions).extracting(Transaction::getTxnId).containsExactly("T2");
+        assertThat(secondTransactions).extracting(Transaction::getConsentId).containsOnly("consent-2");
+    }
+
+    private static FIPResponseDTO response(String consentId, FIPResponseDTO.Fip.Account... accounts) {
+        return FIPResponseDTO.builder()
+                .consentId(consentId)
+                .fips(List.of(FIPResponseDTO.Fip.builder()
+                        .fipID("FIP-1")
+                        .accounts(List.of(accounts))
+                        .build()))
+                .build();
+    }
+
+    private static FIPResponseDTO.Fip.Account account(
+            String linkRefNumber,
+            FIPResponseDTO.Fip.Account.AccountData.AccountDetail.Transactions.Transaction... txns) {
+        return FIPResponseDTO.Fip.Account.builder()
+                .linkRefNumber(linkRefNumber)
+                .data(FIPResponseDTO.Fip.Account.AccountData.builder()
+                        .account(FIPResponseDTO.Fip.Account.AccountData.AccountDetail.builder()
+                                .transactions(FIPResponseDTO.Fip.Account.AccountData.AccountDetail.Transactions.builder()
+                                        .transaction(List.of(txns))
+                                        .build())
+                                .build())
+                        .build())
+                .build();
+    }
+
+    private static FIPResponseDTO.Fip.Account.AccountData.AccountDetail.Transactions.Transaction txn(String txnId) {
+        return FIPResponseDTO.Fip.Account.AccountData.AccountDetail.Transactions.Transaction.builder()
+                .txnId(txnId)
+                .amount("100.00")
+                .mode("UPI")
+                .narration("Test")
+                .transactionTimestamp("2024-01-01T10:00:00+05:30")
+                .build();
+    }
+}